@@ -1,9 +1,333 @@
 from typing import List, Optional, Any, Dict, Tuple, Union
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, ValidationError
 from openpyxl import load_workbook
-from openpyxl.utils import column_index_from_string
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format
+from openpyxl.utils.datetime import from_excel, MAC_EPOCH, WINDOWS_EPOCH
+from xml.etree.ElementTree import iterparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+import datetime
 import json
+import orjson
 import os
+import re
+import threading
+import time
+import zipfile
+
+try:
+    # Optional Rust-backed reader; reads are routed through it when available
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# -------------------------------
+# Range Parsing Helpers
+# -------------------------------
+
+# Recognized Excel file extensions (lowercase; matching is case-insensitive)
+_EXCEL_EXTENSIONS = ('.xlsx', '.xlsm', '.xltx', '.xltm')
+
+# Directory listings keyed by path, each entry (directory mtime, file names)
+_dir_listing_cache: Dict[str, Tuple[float, List[str]]] = {}
+
+# Matches 'start' or 'start-end' with optional whitespace around either element
+_RANGE_RE = re.compile(r'^\s*([A-Za-z0-9]+)\s*(?:-\s*([A-Za-z0-9]+)\s*)?$')
+
+
+def _split_range(range_str: str) -> Tuple[str, str]:
+    """
+    Split a range string into start and end elements.
+
+    Args:
+        range_str (str): Range string (e.g., 'A-C' or '1-10').
+
+    Returns:
+        tuple: (start, end); a single value is returned as both ends.
+
+    Raises:
+        ValueError: If the range format is invalid.
+    """
+    match = _RANGE_RE.match(range_str)
+    if not match:
+        raise ValueError(f"Invalid range format: '{range_str}'. Expected format 'start-end'.")
+    start = match.group(1)
+    end = match.group(2) or start
+    return (start, end)
+
+
+def _column_to_index(col: str) -> int:
+    """
+    Convert a column letter string (e.g., 'A', 'AB') to a 1-based column index.
+    Forward accumulation avoids openpyxl's per-character dict lookups.
+
+    Args:
+        col (str): Column letters.
+
+    Returns:
+        int: 1-based column index.
+
+    Raises:
+        ValueError: If the string contains non-letter characters or is empty.
+    """
+    acc = 0
+    for ch in col.upper():
+        o = ord(ch)
+        if o < 65 or o > 90:
+            raise ValueError(f"'{col}' is not a valid column name.")
+        acc = acc * 26 + (o - 64)
+    if acc == 0:
+        raise ValueError(f"'{col}' is not a valid column name.")
+    return acc
+
+
+@lru_cache(maxsize=4096)
+def _parse_bounds(columns_range: str, rows_range: str) -> Tuple[int, int, int, int]:
+    """
+    Parse column and row range strings into numeric bounds.
+    Results are memoized since the same range strings recur across reads.
+
+    Args:
+        columns_range (str): Columns range (e.g., 'A-C').
+        rows_range (str): Rows range (e.g., '1-10').
+
+    Returns:
+        Tuple[int, int, int, int]: (start_col, end_col, row_start, row_end).
+
+    Raises:
+        ValueError: If column or row range is invalid.
+    """
+    # Parse the columns range
+    try:
+        start_col_str, end_col_str = _split_range(columns_range)
+        start_col = _column_to_index(start_col_str)
+        end_col = _column_to_index(end_col_str)
+    except ValueError as ve:
+        raise ValueError(f"Invalid columns_range: {ve}")
+
+    # Parse the rows range
+    try:
+        row_start_str, row_end_str = _split_range(rows_range)
+        row_start, row_end = int(row_start_str), int(row_end_str)
+        if row_start > row_end:
+            raise ValueError(f"Start row {row_start} is greater than end row {row_end}.")
+    except Exception:
+        raise ValueError(f"Invalid rows_range format: '{rows_range}'. Expected format 'start-end'.")
+
+    return start_col, end_col, row_start, row_end
+
+# -------------------------------
+# Streaming XLSX Reader
+# -------------------------------
+
+_SSML_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_RELS_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_DOC_RELS_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+
+class _XlsxStreamReader:
+    """
+    Minimal streaming reader for rectangular value ranges in an xlsx file.
+
+    Opens the file as a zip and SAX-parses only the requested sheet's XML with
+    iterparse, stopping as soon as the last requested row has been seen. Never
+    materializes a workbook DOM, so memory stays O(range) instead of
+    O(workbook). Shared strings and date styles are parsed once per file.
+    """
+
+    def __init__(self, file_path: str):
+        self._zip = zipfile.ZipFile(file_path)
+        self._sheet_paths: Optional[Dict[str, str]] = None
+        self._shared_strings: Optional[List[str]] = None
+        self._date_style_ids: Optional[set] = None
+        self._epoch = WINDOWS_EPOCH
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def sheet_names(self) -> List[str]:
+        """
+        Sheet names in workbook order.
+        """
+        return list(self._load_sheet_paths().keys())
+
+    def _load_sheet_paths(self) -> Dict[str, str]:
+        """
+        Map sheet names to their zip entry paths via workbook.xml and its rels.
+        Also picks up the date1904 workbook setting while the XML is open.
+        """
+        if self._sheet_paths is not None:
+            return self._sheet_paths
+        rel_targets = {}
+        with self._zip.open('xl/_rels/workbook.xml.rels') as f:
+            for _, elem in iterparse(f):
+                if elem.tag == f'{_RELS_NS}Relationship':
+                    target = elem.get('Target')
+                    if target.startswith('/'):
+                        target = target[1:]
+                    elif not target.startswith('xl/'):
+                        target = 'xl/' + target
+                    rel_targets[elem.get('Id')] = target
+        sheet_paths = {}
+        with self._zip.open('xl/workbook.xml') as f:
+            for _, elem in iterparse(f):
+                if elem.tag == f'{_SSML_NS}sheet':
+                    rel_id = elem.get(f'{_DOC_RELS_NS}id')
+                    if rel_id in rel_targets:
+                        sheet_paths[elem.get('name')] = rel_targets[rel_id]
+                elif elem.tag == f'{_SSML_NS}workbookPr':
+                    if elem.get('date1904') in ('1', 'true'):
+                        self._epoch = MAC_EPOCH
+        self._sheet_paths = sheet_paths
+        return sheet_paths
+
+    def _load_shared_strings(self) -> List[str]:
+        """
+        Load the shared strings table (all text of each <si> entry).
+        """
+        if self._shared_strings is not None:
+            return self._shared_strings
+        strings = []
+        try:
+            with self._zip.open('xl/sharedStrings.xml') as f:
+                for _, elem in iterparse(f):
+                    if elem.tag == f'{_SSML_NS}si':
+                        strings.append(''.join(t.text or '' for t in elem.iter(f'{_SSML_NS}t')))
+                        elem.clear()
+        except KeyError:
+            pass  # No shared strings in this file
+        self._shared_strings = strings
+        return strings
+
+    def _load_date_styles(self) -> set:
+        """
+        Collect the cellXfs style indices whose number format is a date format,
+        so numeric cells using them can be converted to datetimes.
+        """
+        if self._date_style_ids is not None:
+            return self._date_style_ids
+        date_style_ids = set()
+        try:
+            custom_formats = {}
+            xf_index = 0
+            in_cell_xfs = False
+            with self._zip.open('xl/styles.xml') as f:
+                for event, elem in iterparse(f, events=('start', 'end')):
+                    if event == 'start':
+                        if elem.tag == f'{_SSML_NS}cellXfs':
+                            in_cell_xfs = True
+                        continue
+                    if elem.tag == f'{_SSML_NS}numFmt':
+                        custom_formats[int(elem.get('numFmtId'))] = elem.get('formatCode', '')
+                    elif elem.tag == f'{_SSML_NS}xf' and in_cell_xfs:
+                        fmt_id = int(elem.get('numFmtId', '0'))
+                        fmt = custom_formats.get(fmt_id, BUILTIN_FORMATS.get(fmt_id, ''))
+                        if fmt and is_date_format(fmt):
+                            date_style_ids.add(xf_index)
+                        xf_index += 1
+                    elif elem.tag == f'{_SSML_NS}cellXfs':
+                        in_cell_xfs = False
+        except KeyError:
+            pass  # No styles part
+        self._date_style_ids = date_style_ids
+        return date_style_ids
+
+    def read_rows(
+        self, sheet_name: str, min_row: int, max_row: int, min_col: int, max_col: int
+    ) -> List[Tuple]:
+        """
+        Read a rectangular range as a list of row tuples (like iter_rows with
+        values_only=True), streaming the sheet XML and stopping at max_row.
+
+        Args:
+            sheet_name (str): Name of the sheet.
+            min_row (int): First row (1-based).
+            max_row (int): Last row (1-based).
+            min_col (int): First column (1-based).
+            max_col (int): Last column (1-based).
+
+        Returns:
+            List[Tuple]: One tuple of values per requested row.
+
+        Raises:
+            KeyError: If the sheet does not exist in the file.
+        """
+        sheet_path = self._load_sheet_paths()[sheet_name]
+        date_style_ids = self._load_date_styles()
+        width = max_col - min_col + 1
+        rows: Dict[int, List[Any]] = {}
+        cell_tag = f'{_SSML_NS}c'
+        row_tag = f'{_SSML_NS}row'
+        # The r attributes are optional per ECMA-376: a row or cell without
+        # one occupies the position right after its predecessor, so implicit
+        # positions are tracked alongside the explicit references.
+        current_row = 0
+        next_col = 1
+        with self._zip.open(sheet_path) as f:
+            for event, elem in iterparse(f, events=('start', 'end')):
+                if event == 'start':
+                    if elem.tag == row_tag:
+                        row_ref = elem.get('r')
+                        current_row = int(row_ref) if row_ref is not None else current_row + 1
+                        next_col = 1
+                elif elem.tag == cell_tag:
+                    ref = elem.get('r')
+                    if ref is not None:
+                        letters = ref.rstrip('0123456789')
+                        row_num = int(ref[len(letters):])
+                        col_num = _column_to_index(letters)
+                    else:
+                        row_num = current_row
+                        col_num = next_col
+                    next_col = col_num + 1
+                    if row_num < min_row or row_num > max_row:
+                        continue
+                    if col_num < min_col or col_num > max_col:
+                        continue
+                    value = self._cell_value(elem, date_style_ids)
+                    if value is not None:
+                        rows.setdefault(row_num, [None] * width)[col_num - min_col] = value
+                elif elem.tag == row_tag:
+                    elem.clear()
+                    if current_row >= max_row:
+                        break  # Everything requested has been parsed
+        empty = (None,) * width
+        return [
+            tuple(rows[r]) if r in rows else empty
+            for r in range(min_row, max_row + 1)
+        ]
+
+    def _cell_value(self, cell, date_style_ids: set) -> Any:
+        """
+        Decode a <c> element into a Python value, mirroring openpyxl's
+        data_only semantics (cached values, booleans, dates). The shared
+        strings table is loaded on the first shared-string cell, so sheets
+        of purely numeric data never pay for it.
+        """
+        cell_type = cell.get('t', 'n')
+        if cell_type == 'inlineStr':
+            return ''.join(t.text or '' for t in cell.iter(f'{_SSML_NS}t'))
+        v = cell.find(f'{_SSML_NS}v')
+        if v is None or v.text is None:
+            return None
+        text = v.text
+        if cell_type == 's':
+            return self._load_shared_strings()[int(text)]
+        if cell_type in ('str', 'e'):
+            return text
+        if cell_type == 'b':
+            return text in ('1', 'true')
+        # Numeric cell; date-styled numbers become datetimes
+        try:
+            number = int(text)
+        except ValueError:
+            number = float(text)
+        style = cell.get('s')
+        if style is not None and int(style) in date_style_ids:
+            return from_excel(number, self._epoch)
+        return number
+
 
 # -------------------------------
 # Pydantic Models
@@ -13,6 +337,9 @@ class CellRange(BaseModel):
     """
     Represents a range of cells within specified columns and rows in an Excel sheet.
     """
+    # Core schemas are built on first validation, not at import time
+    model_config = ConfigDict(defer_build=True)
+
     columns_range: Optional[str] = Field(
         None,
         description="The range of columns (e.g., 'A-C').",
@@ -23,16 +350,33 @@ class CellRange(BaseModel):
     )
     values: Optional[List[Union[str,int,float, None]]] = Field(
         None,
-        description="The values of the cell range.",
-        repr=False
+        description="The values of the cell range. Derived from the ranges, so excluded from serialization.",
+        repr=False,
+        exclude=True
     )
+    _bounds: Optional[Tuple[int, int, int, int]] = PrivateAttr(default=None)
+
+    def parsed_bounds(self) -> Tuple[int, int, int, int]:
+        """
+        Return (start_col, end_col, row_start, row_end) for this range,
+        parsing the range strings once and memoizing the result.
+
+        Raises:
+            ValueError: If either range string is missing or invalid.
+        """
+        if self._bounds is None:
+            if not self.columns_range or not self.rows_range:
+                raise ValueError("Both 'columns_range' and 'rows_range' must be specified in CellRange.")
+            self._bounds = _parse_bounds(self.columns_range, self.rows_range)
+        return self._bounds
 
-    
 
 class DataPair(BaseModel):
     """
     Represents a pair of source and target (MT) cell ranges within a sheet.
     """
+    model_config = ConfigDict(defer_build=True)
+
     src: CellRange = Field(
         default_factory=CellRange,
         description="Source cell range."
@@ -42,11 +386,35 @@ class DataPair(BaseModel):
         description="MT cell range."
     )
 
+    def range_key(self) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+        """
+        Return the tuple of range strings that uniquely identifies this pair.
+        Values are derived from the ranges, so they are not part of the key.
+        """
+        return (
+            self.src.columns_range,
+            self.src.rows_range,
+            self.mt.columns_range,
+            self.mt.rows_range,
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        # A pair's identity is its ranges; values are derived from them,
+        # so Pydantic's recursive comparison over the values lists is skipped.
+        if not isinstance(other, DataPair):
+            return NotImplemented
+        return self.range_key() == other.range_key()
+
+    def __hash__(self) -> int:
+        return hash(self.range_key())
+
 
 class SheetSchema(BaseModel):
     """
     Represents a single sheet within the Excel file, identified by sheet_id and containing data pairs.
     """
+    model_config = ConfigDict(defer_build=True)
+
     sheet_id: Optional[str] = Field(
         None,
         description="Unique identifier for the sheet."
@@ -55,11 +423,25 @@ class SheetSchema(BaseModel):
         default_factory=list,
         description="List of data pairs within the sheet."
     )
+    _pair_key_index: Optional[Dict[Tuple, int]] = PrivateAttr(default=None)
+
+    def _pair_index(self) -> Dict[Tuple, int]:
+        """
+        Map of DataPair range keys to their index in sheet_data, built lazily.
+        Not serialized; invalidated by setting it back to None.
+        """
+        if self._pair_key_index is None:
+            self._pair_key_index = {
+                pair.range_key(): i for i, pair in enumerate(self.sheet_data)
+            }
+        return self._pair_key_index
 
 class FileSchema(BaseModel):
     """
     Represents the overall schema of the Excel file, including its path and contained sheets.
     """
+    model_config = ConfigDict(defer_build=True)
+
     file_path: str = Field(
         ...,
         description="Path to the Excel file."
@@ -69,6 +451,48 @@ class FileSchema(BaseModel):
         description="List of sheets in the Excel file."
     )
 
+# Built once per process, on first use, so repeated loads/dumps reuse the same
+# validator/serializer without forcing schema construction at import time
+_FILE_SCHEMA_ADAPTER: Optional[TypeAdapter] = None
+
+
+def _file_schema_adapter() -> TypeAdapter:
+    global _FILE_SCHEMA_ADAPTER
+    if _FILE_SCHEMA_ADAPTER is None:
+        _FILE_SCHEMA_ADAPTER = TypeAdapter(FileSchema)
+    return _FILE_SCHEMA_ADAPTER
+
+
+def _construct_file_schema(data: Dict[str, Any]) -> FileSchema:
+    """
+    Build a FileSchema tree with model_construct, skipping validation.
+
+    Only safe for JSON this module wrote itself (autosave files); schemas
+    from external sources go through full validation in load_from_file.
+
+    Args:
+        data (Dict[str, Any]): Parsed JSON produced by to_json/autosave.
+
+    Returns:
+        FileSchema: The reconstructed schema.
+    """
+    return FileSchema.model_construct(
+        file_path=data['file_path'],
+        file_data=[
+            SheetSchema.model_construct(
+                sheet_id=sheet.get('sheet_id'),
+                sheet_data=[
+                    DataPair.model_construct(
+                        src=CellRange.model_construct(**pair['src']),
+                        mt=CellRange.model_construct(**pair['mt']),
+                    )
+                    for pair in sheet.get('sheet_data', [])
+                ],
+            )
+            for sheet in data.get('file_data', [])
+        ],
+    )
+
 # -------------------------------
 # ExcelPairer Class
 # -------------------------------
@@ -88,14 +512,22 @@ class ExcelDataPairer:
         - List and select Excel files from a directory.
     """
 
-    def __init__(self, file_path: Optional[str] = None, autoload: bool = False):
+    # Minimum seconds between consecutive autosave writes outside of bulk()
+    _AUTOSAVE_MIN_INTERVAL = 0.1
+
+    def __init__(self, file_path: Optional[str] = None, autoload: bool = False, read_only: bool = True):
         """
         Initialize the ExcelNavigator. If file_path is provided, loads the Excel file.
-        
+
         Args:
             file_path (Optional[str]): Path to the Excel file.
             autoload (bool): If True, attempts to load configuration from an autosave file.
+            read_only (bool): If True (default), the workbook is opened in OpenPyXL's
+                read-only mode, which is much faster and lighter for extraction.
+                Set to False if full random access to self.workbook is needed;
+                write operations use a separate writable workbook either way.
         """
+        self.read_only = read_only
         self.file_schema: Optional[FileSchema] = None
         self.autosave = False  # Autosave is disabled until a file is selected
         self.waiting_for_autosave = autoload
@@ -103,9 +535,43 @@ class ExcelDataPairer:
         os.makedirs(self.autosave_dir, exist_ok=True)
         self.autosave_path: Optional[str] = None
         self.workbook = None
+        self._rw_workbook = None
+        self._sheet_cache: Dict[str, Any] = {}
+        self._sheet_index: Dict[str, SheetSchema] = {}
+        self._sheetnames: Optional[List[str]] = None
+        self._autosave_suspended = False
+        self._autosave_pending = False
+        self._last_autosave_ts = 0.0
+        self._last_autosaved_hash: Optional[int] = None
+        self._workbook_dirty = False
+        self._calamine_workbook = None
+        self._calamine_sheet_cache: Dict[str, List[List[Any]]] = {}
+        self._stream_reader: Optional[_XlsxStreamReader] = None
+        # Serializes openpyxl/calamine access; their handles are not thread-safe
+        self._workbook_lock = threading.Lock()
         if file_path:
             self.select_excel_file(file_path=file_path, autoload=autoload)
 
+    @property
+    def workbook(self):
+        """
+        The read (data_only) OpenPyXL workbook, loaded lazily on first access.
+        Reads served by the streaming/calamine backends never trigger the load.
+        """
+        if self._workbook is None and self.file_schema:
+            try:
+                self._workbook = load_workbook(
+                    filename=self.file_schema.file_path, data_only=True,
+                    read_only=self.read_only, keep_links=False
+                )
+            except Exception as e:
+                raise ValueError(f"Failed to load Excel file '{self.file_schema.file_path}': {e}")
+        return self._workbook
+
+    @workbook.setter
+    def workbook(self, value):
+        self._workbook = value
+
     # ---------------------------
     # File Selection Methods
     # ---------------------------
@@ -124,14 +590,26 @@ class ExcelDataPairer:
         Raises:
             FileNotFoundError: If the directory does not exist.
         """
-        excel_extensions = ('.xlsx', '.xlsm', '.xltx', '.xltm')
         try:
-            files = os.listdir(dir_path)
-            excel_files = [f for f in files if f.endswith(excel_extensions) and os.path.isfile(os.path.join(dir_path, f))]
-            return excel_files
+            dir_mtime = os.stat(dir_path).st_mtime
         except FileNotFoundError:
             raise FileNotFoundError(f"The directory '{dir_path}' does not exist.")
 
+        cached = _dir_listing_cache.get(dir_path)
+        if cached is not None and cached[0] == dir_mtime:
+            return list(cached[1])
+
+        # scandir's DirEntry.is_file reuses the stat from the directory walk,
+        # avoiding one syscall per entry compared to listdir + isfile
+        with os.scandir(dir_path) as entries:
+            excel_files = [
+                entry.name
+                for entry in entries
+                if entry.name.lower().endswith(_EXCEL_EXTENSIONS) and entry.is_file(follow_symlinks=False)
+            ]
+        _dir_listing_cache[dir_path] = (dir_mtime, excel_files)
+        return list(excel_files)
+
     def select_excel_file(
         self, 
         file_path: Optional[str] = None, 
@@ -185,16 +663,21 @@ class ExcelDataPairer:
             raise ValueError("Must provide 'file_path' or 'dir_path' with 'file_id' or 'file_name'.")
 
         # Now, initialize the file schema, workbook, autosave path, etc.
+        self.flush()  # Unsaved edits belong to the previously selected file
         self.file_schema = FileSchema(file_path=file_path)
+        self._sheet_index = {}
         self.autosave_path = os.path.join(
-            self.autosave_dir, 
+            self.autosave_dir,
             os.path.splitext(os.path.basename(file_path))[0] + "_autosave.json"
         )
-        try:
-            self.workbook = load_workbook(filename=file_path, data_only=True)
-            print(f"Excel file '{file_path}' loaded successfully.")
-        except Exception as e:
-            raise ValueError(f"Failed to load Excel file '{file_path}': {e}")
+        self._last_autosaved_hash = None  # New target file; nothing written yet
+        # The workbook itself is loaded lazily on first access, so selecting a
+        # file is instant and schema-only workflows never pay for the parse;
+        # the previous file's workbook is closed so its handle is released
+        self._reload_readonly_workbook()
+        self._rw_workbook = None
+        self._workbook_dirty = False
+        print(f"Excel file '{file_path}' selected successfully.")
         
         if autoload:
             self._autoload_config()
@@ -215,29 +698,101 @@ class ExcelDataPairer:
     def disable_autosave(self):
         """
         Disable automatic saving of the configuration.
+        Any throttled autosave still pending is written out first.
         """
+        if self._autosave_pending:
+            self._flush_autosave()
         self.autosave = False
         print("Autosave disabled.")
 
+    def __del__(self):
+        # Write out a throttled autosave that never got flushed. Deferred
+        # workbook edits are deliberately NOT saved here: interpreter
+        # shutdown is too unreliable to trust with a full .xlsx rewrite,
+        # so unflushed edits require an explicit flush() or a with block.
+        try:
+            if getattr(self, '_autosave_pending', False):
+                self._flush_autosave()
+        except Exception:
+            pass
+
+    @contextmanager
+    def bulk(self):
+        """
+        Context manager that suspends autosave writes for a batch of mutations
+        and flushes a single autosave on exit.
+
+        Usage:
+            with pairer.bulk():
+                for ... : pairer.add_data_pair(...)
+        """
+        self._autosave_suspended = True
+        try:
+            yield self
+        finally:
+            self._autosave_suspended = False
+            if self._autosave_pending:
+                self._flush_autosave()
+
     def _autosave_config(self):
         """
         Automatically save the current schema to an autosave file if autosave is enabled.
+        Writes are skipped while bulk() is active and throttled when mutations
+        arrive in quick succession; skipped writes are flushed later.
         """
-        if self.autosave and self.file_schema:
-            try:
-                with open(self.autosave_path, 'w', encoding='utf-8') as f:
-                    f.write(self.to_json())
-                #print(f"Autosaved schema to '{self.autosave_path}'.")
-            except Exception as e:
-                print(f"Failed to autosave schema: {e}")
+        if not (self.autosave and self.file_schema):
+            return
+        if self._autosave_suspended:
+            self._autosave_pending = True
+            return
+        if time.monotonic() - self._last_autosave_ts < self._AUTOSAVE_MIN_INTERVAL:
+            self._autosave_pending = True
+            return
+        self._flush_autosave()
+
+    def _flush_autosave(self):
+        """
+        Write the autosave file if the schema changed since the last write
+        (if autosave is enabled).
+        """
+        if not (self.autosave and self.file_schema):
+            return
+        try:
+            payload = self.to_json_bytes(indent=False)
+            fingerprint = hash(payload)
+            if fingerprint == self._last_autosaved_hash:
+                # Nothing changed since the last write; skip the disk I/O
+                self._autosave_pending = False
+                return
+            # Write to a sibling temp file and swap it in atomically so a
+            # crash mid-write can never corrupt an existing autosave.
+            tmp_path = self.autosave_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.autosave_path)
+            self._last_autosave_ts = time.monotonic()
+            self._last_autosaved_hash = fingerprint
+            self._autosave_pending = False
+            #print(f"Autosaved schema to '{self.autosave_path}'.")
+        except Exception as e:
+            print(f"Failed to autosave schema: {e}")
 
     def _autoload_config(self):
         """
         Automatically load the schema from an autosave file if it exists.
+        Autosave files are written by this class, so the models are rebuilt
+        with model_construct instead of re-running full validation.
         """
         if os.path.exists(self.autosave_path):
             try:
-                self.load_from_file(self.autosave_path)
+                with open(self.autosave_path, 'rb') as f:
+                    self.file_schema = _construct_file_schema(orjson.loads(f.read()))
+                self._reload_readonly_workbook()
+                self._rw_workbook = None
+                self._workbook_dirty = False
+                self._sheet_index = {
+                    sheet.sheet_id: sheet for sheet in self.file_schema.file_data if sheet.sheet_id
+                }
                 print(f"Configuration autoloaded from '{self.autosave_path}'.")
             except Exception as e:
                 print(f"Failed to autoload configuration: {e}")
@@ -268,10 +823,12 @@ class ExcelDataPairer:
             else:
                 print(f"Sheet with id '{sheet_id}' already exists in the schema.")
                 return
-        if sheet_id not in self.workbook.sheetnames:
+        if sheet_id not in self.list_file_sheets():
             raise ValueError(f"Sheet '{sheet_id}' does not exist in the Excel file.")
-        new_sheet = SheetSchema(sheet_id=sheet_id)
+        # sheet_id was just checked against the workbook, so skip re-validation
+        new_sheet = SheetSchema.model_construct(sheet_id=sheet_id, sheet_data=[])
         self.file_schema.file_data.append(new_sheet)
+        self._sheet_index[sheet_id] = new_sheet
         print(f"Sheet '{sheet_id}' added to schema successfully.")
         self._autosave_config()
 
@@ -292,21 +849,70 @@ class ExcelDataPairer:
         sheet_schema = self._find_sheet(sheet_id)
         if not sheet_schema:
             raise ValueError(f"Sheet with id '{sheet_id}' does not exist in the schema.")
-        if sheet_id not in self.workbook.sheetnames:
+        if sheet_id not in self.list_file_sheets():
             raise ValueError(f"Sheet '{sheet_id}' does not exist in the Excel file.")
 
         # Remove from schema
         self.file_schema.file_data.remove(sheet_schema)
+        self._sheet_index.pop(sheet_id, None)
+        self._sheet_cache.pop(sheet_id, None)
 
-        # Remove from workbook
-        del self.workbook[sheet_id]
+        # Remove from workbook (writable copy; the read-only workbook is reloaded after saving)
+        rw_workbook = self._get_rw_workbook()
+        del rw_workbook[sheet_id]
         try:
-            self.workbook.save(self.file_schema.file_path)
+            rw_workbook.save(self.file_schema.file_path)
+            self._reload_readonly_workbook()
             print(f"Sheet '{sheet_id}' removed successfully from schema and workbook.")
             self._autosave_config()
         except Exception as e:
             print(f"Failed to save workbook after removing sheet '{sheet_id}': {e}")
 
+    def remove_sheet_from_schema(self, sheet_id: Union[str, int]) -> None:
+        """
+        Remove a sheet from the schema only, leaving the Excel file untouched.
+        O(1) and involves no workbook IO, unlike remove_sheet.
+
+        Args:
+            sheet_id (Union[str, int]): Identifier of the sheet to remove.
+
+        Raises:
+            ValueError: If the sheet does not exist in the schema.
+        """
+        if not self.file_schema:
+            raise ValueError("No Excel file selected. Please select an Excel file before removing a sheet.")
+        if isinstance(sheet_id, int):
+            sheet_id = self.list_file_sheets()[sheet_id]
+        sheet_schema = self._find_sheet(sheet_id)
+        if not sheet_schema:
+            raise ValueError(f"Sheet with id '{sheet_id}' does not exist in the schema.")
+        self.file_schema.file_data.remove(sheet_schema)
+        self._sheet_index.pop(sheet_id, None)
+        print(f"Sheet '{sheet_id}' removed from schema.")
+        self._autosave_config()
+
+    def remove_sheet_from_workbook(self, sheet_id: Union[str, int]) -> None:
+        """
+        Delete a sheet from the Excel file itself and save the workbook.
+        The schema is not changed; use remove_sheet to remove from both.
+
+        Args:
+            sheet_id (Union[str, int]): Identifier of the sheet to delete.
+
+        Raises:
+            ValueError: If the sheet does not exist in the Excel file.
+        """
+        if not self.file_schema:
+            raise ValueError("No Excel file selected. Please select an Excel file before removing a sheet.")
+        if isinstance(sheet_id, int):
+            sheet_id = self.list_file_sheets()[sheet_id]
+        if sheet_id not in self.list_file_sheets():
+            raise ValueError(f"Sheet '{sheet_id}' does not exist in the Excel file.")
+        rw_workbook = self._get_rw_workbook()
+        del rw_workbook[sheet_id]
+        self._workbook_dirty = True
+        print(f"Sheet '{sheet_id}' removed from workbook.")
+
     def list_sheets(self) -> List[str]:
         """
         List all sheet identifiers in the schema.
@@ -316,7 +922,8 @@ class ExcelDataPairer:
         """
         if not self.file_schema:
             raise ValueError("No Excel file selected. Please select an Excel file to list sheets.")
-        return [sheet.sheet_id for sheet in self.file_schema.file_data if sheet.sheet_id]
+        # The index mirrors file_data (insertion-ordered, non-empty ids only)
+        return list(self._sheet_index.keys())
 
     # ---------------------------
     # Data Pair Management Methods
@@ -326,9 +933,11 @@ class ExcelDataPairer:
         sheet_id: Union[str, int], 
         src_columns_range: str, 
         src_rows_range: str, 
-        mt_columns_range: Optional[str]=None, 
+        mt_columns_range: Optional[str]=None,
         mt_rows_range: Optional[str]=None,
-        present_ok:bool=True
+        present_ok:bool=True,
+        src_values: Optional[List[Any]]=None,
+        mt_values: Optional[List[Any]]=None
     ) -> None:
         """
         Add a data pair to a specified sheet in the Excel schema.
@@ -342,6 +951,8 @@ class ExcelDataPairer:
             mt_columns_range (Optional[str]): MT columns range (e.g., 'D-F'). Defaults to src_columns_range if not provided.
             mt_rows_range (Optional[str]): MT rows range (e.g., '1-10'). Defaults to src_rows_range if not provided.
             present_ok (bool): If True, does not raise an error if the data pair already exists, skips adding.
+            src_values (Optional[List[Any]]): Already-read source values (e.g., from preview_range); read from the file if not provided.
+            mt_values (Optional[List[Any]]): Already-read MT values; read from the file if not provided.
 
         Raises:
             ValueError: If the specified sheet does not exist or a duplicate data pair is detected.
@@ -378,34 +989,36 @@ class ExcelDataPairer:
             if not sheet:
                 raise ValueError(f"Failed to add sheet '{sheet_id}' to the schema.")
         
-        # Retrieve values from the specified ranges
-        src_values = self.preview_range(sheet_id, src_columns_range, src_rows_range)
-        mt_values = self.preview_range(sheet_id, mt_columns_range, mt_rows_range)
+        # Retrieve values from the specified ranges, skipping any the caller
+        # already read (e.g., via preview_range)
+        if src_values is None:
+            src_values = self._read_range_raw(sheet_id, src_columns_range, src_rows_range)
+        if mt_values is None:
+            mt_values = self._read_range_raw(sheet_id, mt_columns_range, mt_rows_range)
         
         # Create the new DataPair
-        new_data_pair = DataPair(
-            src=CellRange(columns_range=src_columns_range, rows_range=src_rows_range, values=src_values),
-            mt=CellRange(columns_range=mt_columns_range, rows_range=mt_rows_range, values=mt_values)
+        # The range strings were already validated by the reads above, so skip re-validation
+        new_data_pair = DataPair.model_construct(
+            src=CellRange.model_construct(columns_range=src_columns_range, rows_range=src_rows_range, values=src_values),
+            mt=CellRange.model_construct(columns_range=mt_columns_range, rows_range=mt_rows_range, values=mt_values)
         )
 
-        # Check for duplicates and update if necessary
-        added = False
-        for i, existing_pair in enumerate(sheet.sheet_data):
-            if existing_pair == new_data_pair:
-                if not present_ok:
-                    raise ValueError(
-                        f"Duplicate DataPair detected in sheet '{sheet_id}'. "
-                        f"The DataPair({existing_pair}) already exists."
-                    )
-                else:
-                    print(f"DataPair({existing_pair}) already exists in sheet '{sheet_id}'. Updating...")
-                    sheet.sheet_data[i] = new_data_pair
-                    added = True
-                    break  # Exit loop after updating
-
-        # If no duplicate found, append the new DataPair
-        if not added:
-            sheet.sheet_data.append(new_data_pair) 
+        # Check for duplicates via the per-sheet range-key index (O(1) per insert)
+        pair_index = sheet._pair_index()
+        existing_i = pair_index.get(new_data_pair.range_key())
+        if existing_i is not None:
+            existing_pair = sheet.sheet_data[existing_i]
+            if not present_ok:
+                raise ValueError(
+                    f"Duplicate DataPair detected in sheet '{sheet_id}'. "
+                    f"The DataPair({existing_pair}) already exists."
+                )
+            else:
+                print(f"DataPair({existing_pair}) already exists in sheet '{sheet_id}'. Updating...")
+                sheet.sheet_data[existing_i] = new_data_pair
+        else:
+            sheet.sheet_data.append(new_data_pair)
+            pair_index[new_data_pair.range_key()] = len(sheet.sheet_data) - 1
             print(f"DataPair({new_data_pair}) added to sheet '{sheet_id}' successfully.")
         
         # Autosave the configuration if enabled
@@ -430,6 +1043,7 @@ class ExcelDataPairer:
             raise ValueError(f"Sheet with id '{sheet_id}' does not exist in the schema.")
         try:
             sheet_schema.sheet_data.pop(index)
+            sheet_schema._pair_key_index = None  # Indices shifted; rebuild lazily
             print(f"Removed data pair at index {index} from sheet '{sheet_id}'.")
             self._autosave_config()
         except IndexError:
@@ -477,7 +1091,7 @@ class ExcelDataPairer:
         Raises:
             ValueError: If the sheet does not exist or ranges are invalid.
         """
-        if not self.file_schema or not self.workbook:
+        if not self.file_schema:
             raise ValueError("No Excel file selected. Please select an Excel file before retrieving data.")
         if isinstance(sheet_id, int):
             sheet_id = self.list_file_sheets()[sheet_id]
@@ -485,13 +1099,11 @@ class ExcelDataPairer:
         if not sheet_schema:
             raise ValueError(f"Sheet with id '{sheet_id}' does not exist in the schema.")
         
-        if sheet_id not in self.workbook.sheetnames:
+        if sheet_id not in self.list_file_sheets():
             raise ValueError(f"Sheet '{sheet_id}' does not exist in the Excel file.")
-        
-        sheet = self.workbook[sheet_id]
-        
-        src_data = self._read_range(sheet, src)
-        mt_data = self._read_range(sheet, mt)
+
+        src_data = self._read_range(sheet_id, src)
+        mt_data = self._read_range(sheet_id, mt)
         
         return {
             "src": src_data,
@@ -505,26 +1117,153 @@ class ExcelDataPairer:
         Returns:
             Dict[str, List[Dict[str, List[Any]]]]: A dictionary with sheet IDs as keys and lists of data pairs as values.
         """
-        if not self.file_schema or not self.workbook:
+        if not self.file_schema:
             raise ValueError("No Excel file selected. Please select an Excel file before retrieving data.")
         all_data = {}
+        file_sheets = set(self.list_file_sheets())
+        pending = []
         for sheet_schema in self.file_schema.file_data:
             sheet_id = sheet_schema.sheet_id
             if not sheet_id:
                 continue  # Skip sheets without an ID
-            if sheet_id not in self.workbook.sheetnames:
+            if sheet_id not in file_sheets:
                 print(f"Warning: Sheet '{sheet_id}' is defined in schema but does not exist in the Excel file.")
                 continue
-            sheet = self.workbook[sheet_id]
             all_data[sheet_id] = []
-            for data_pair in sheet_schema.sheet_data:
-                try:
-                    data = self.get_data(sheet_id, data_pair.src, data_pair.mt)
-                    all_data[sheet_id].append(data)
-                except ValueError as ve:
-                    print(f"Error retrieving data from sheet '{sheet_id}': {ve}")
+            if sheet_schema.sheet_data:
+                pending.append(sheet_schema)
+        if len(pending) > 1:
+            # Sheets are independent and reads spend most of their time in zip
+            # inflation and XML parsing, so they are streamed concurrently.
+            # Initialize the stream reader up front so workers don't race its
+            # lazy construction; openpyxl/calamine fallbacks are serialized
+            # behind _workbook_lock.
+            self._stream_sheetnames()
+            with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                for sheet_schema, pairs in zip(pending, executor.map(self._read_sheet_pairs, pending)):
+                    all_data[sheet_schema.sheet_id] = pairs
+        else:
+            for sheet_schema in pending:
+                all_data[sheet_schema.sheet_id] = self._read_sheet_pairs(sheet_schema)
         return all_data
 
+    def _read_sheet_pairs(self, sheet_schema: SheetSchema) -> List[Dict[str, List[Any]]]:
+        """
+        Read every data pair of one schema sheet, slicing out of the shared
+        bounding grid when possible.
+
+        Args:
+            sheet_schema (SheetSchema): The sheet whose pairs should be read.
+
+        Returns:
+            List[Dict[str, List[Any]]]: One {'src': ..., 'mt': ...} dict per pair.
+        """
+        sheet_id = sheet_schema.sheet_id
+        pairs = []
+        grid, grid_origin = self._bounding_grid(sheet_id, sheet_schema.sheet_data)
+        for data_pair in sheet_schema.sheet_data:
+            try:
+                if grid is not None:
+                    data = {
+                        "src": self._slice_grid(grid, grid_origin, data_pair.src.parsed_bounds()),
+                        "mt": self._slice_grid(grid, grid_origin, data_pair.mt.parsed_bounds()),
+                    }
+                else:
+                    data = self.get_data(sheet_id, data_pair.src, data_pair.mt)
+                pairs.append(data)
+            except ValueError as ve:
+                print(f"Error retrieving data from sheet '{sheet_id}': {ve}")
+        return pairs
+
+    def _bounding_grid(self, sheet_id: str, pairs: List[DataPair]) -> Tuple[Optional[List[Any]], Optional[Tuple[int, int]]]:
+        """
+        Read the bounding box covering all of a sheet's pair ranges in one pass.
+
+        Args:
+            sheet_id (str): Name of the sheet.
+            pairs (List[DataPair]): Data pairs whose ranges define the box.
+
+        Returns:
+            Tuple[Optional[List[Any]], Optional[Tuple[int, int]]]: The value grid
+            and its (min_col, min_row) origin, or (None, None) when per-pair
+            reads should be used instead (calamine active or unparsable ranges).
+        """
+        if CalamineWorkbook is not None and self._calamine_rows(sheet_id) is not None:
+            # Calamine already caches the whole sheet; slicing it again per pair is cheap
+            return None, None
+        bounds = []
+        for pair in pairs:
+            try:
+                bounds.append(pair.src.parsed_bounds())
+                bounds.append(pair.mt.parsed_bounds())
+            except ValueError:
+                # Let the per-pair path surface the error for the offending pair
+                return None, None
+        min_col = min(b[0] for b in bounds)
+        max_col = max(b[1] for b in bounds)
+        min_row = min(b[2] for b in bounds)
+        max_row = max(b[3] for b in bounds)
+        grid = self._stream_rows(sheet_id, min_row, max_row, min_col, max_col)
+        if grid is None:
+            with self._workbook_lock:
+                grid = list(self._get_ws(sheet_id).iter_rows(
+                    min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True
+                ))
+        return grid, (min_col, min_row)
+
+    @staticmethod
+    def _slice_grid(grid: List[Any], origin: Tuple[int, int], bounds: Tuple[int, int, int, int]) -> List[Any]:
+        """
+        Slice a pair range out of a bounding-box grid.
+
+        Args:
+            grid (List[Any]): Rows read from the bounding box.
+            origin (Tuple[int, int]): (min_col, min_row) of the grid.
+            bounds (Tuple[int, int, int, int]): (start_col, end_col, row_start, row_end).
+
+        Returns:
+            List[Any]: A flat list of cell values.
+        """
+        min_col, min_row = origin
+        start_col, end_col, row_start, row_end = bounds
+        return ExcelDataPairer._slice_rows(
+            grid,
+            start_col - min_col + 1,
+            end_col - min_col + 1,
+            row_start - min_row + 1,
+            row_end - min_row + 1,
+        )
+
+    def populate_values(self, sheet_id: Optional[Union[str, int]] = None) -> None:
+        """
+        Re-read cell values from the workbook into the stored CellRanges.
+
+        Values are derived from the ranges and excluded from serialized schemas,
+        so after load_from_file they are empty; call this if the in-memory
+        CellRange.values are needed.
+
+        Args:
+            sheet_id (Optional[Union[str, int]]): Limit to one sheet; all sheets if None.
+
+        Raises:
+            ValueError: If no file is selected or the sheet does not exist.
+        """
+        if not self.file_schema:
+            raise ValueError("No Excel file selected. Please select an Excel file before populating values.")
+        if sheet_id is not None:
+            sheet_schema = self._find_sheet(sheet_id)
+            if not sheet_schema:
+                raise ValueError(f"Sheet with id '{sheet_id}' does not exist in the schema.")
+            sheets = [sheet_schema]
+        else:
+            sheets = self.file_schema.file_data
+        for sheet_schema in sheets:
+            if not sheet_schema.sheet_id:
+                continue
+            for data_pair in sheet_schema.sheet_data:
+                data_pair.src.values = self._read_range(sheet_schema.sheet_id, data_pair.src)
+                data_pair.mt.values = self._read_range(sheet_schema.sheet_id, data_pair.mt)
+
     def preview_range(self, sheet_id: Union[str, int], columns_range: str, rows_range: str) -> List[Any]:
         """
         Output a list of values from a specified range in a given sheet.
@@ -540,16 +1279,13 @@ class ExcelDataPairer:
         Raises:
             ValueError: If the sheet does not exist or the range is invalid.
         """
-        if not self.workbook:
+        if not self.file_schema:
             raise ValueError("No Excel file selected. Please select an Excel file before previewing data.")
         if isinstance(sheet_id, int):
             sheet_id = self.list_file_sheets()[sheet_id]
-        if sheet_id not in self.workbook.sheetnames:
+        if sheet_id not in self.list_file_sheets():
             raise ValueError(f"Sheet '{sheet_id}' does not exist in the Excel file.")
-
-        sheet = self.workbook[sheet_id]
-        cell_range = CellRange(columns_range=columns_range, rows_range=rows_range)
-        data = self._read_range(sheet, cell_range)
+        data = self._read_range_raw(sheet_id, columns_range, rows_range)
         #print(f"Preview of range columns '{columns_range} rows {rows_range}' in sheet '{sheet_id}': {data}")
         return data
 
@@ -564,14 +1300,101 @@ class ExcelDataPairer:
         Raises:
             ValueError: If no file is selected.
         """
-        if not self.workbook:
+        if not self.file_schema:
             raise ValueError("No Excel file selected. Please select an Excel file to list its sheets.")
-        return self.workbook.sheetnames
+        self.flush()  # Reads must reflect deferred workbook edits
+        if self._sheetnames is None:
+            if self._workbook is None:
+                # Sheet names come straight from xl/workbook.xml, without
+                # instantiating the workbook or any worksheet
+                self._sheetnames = self._stream_sheetnames()
+            if self._sheetnames is None:
+                self._sheetnames = self.workbook.sheetnames
+        return self._sheetnames
+
+    def _stream_sheetnames(self) -> Optional[List[str]]:
+        """
+        Read the workbook's sheet names via the streaming reader, if possible.
+
+        Returns:
+            Optional[List[str]]: Sheet names in workbook order, or None if the
+            file could not be read this way (the workbook is used instead).
+        """
+        try:
+            if self._stream_reader is None:
+                self._stream_reader = _XlsxStreamReader(self.file_schema.file_path)
+            return self._stream_reader.sheet_names()
+        except Exception:
+            return None
 
     # ---------------------------
     # Helper Methods
     # ---------------------------
 
+    def _get_rw_workbook(self):
+        """
+        Lazily open a writable (non-read-only) copy of the workbook for mutations.
+
+        Returns:
+            Workbook: A writable OpenPyXL workbook object.
+
+        Raises:
+            ValueError: If no file is selected or the workbook cannot be opened.
+        """
+        if not self.file_schema:
+            raise ValueError("No Excel file selected. Please select an Excel file before modifying the workbook.")
+        if self._rw_workbook is None:
+            try:
+                self._rw_workbook = load_workbook(filename=self.file_schema.file_path, data_only=False)
+            except Exception as e:
+                raise ValueError(f"Failed to open Excel file '{self.file_schema.file_path}' for writing: {e}")
+        return self._rw_workbook
+
+    def _reload_readonly_workbook(self) -> None:
+        """
+        Drop the read workbook and derived caches so that the next read
+        reflects saved changes; the reload itself happens lazily.
+        """
+        if self._workbook is not None:
+            try:
+                self._workbook.close()
+            except Exception:
+                pass
+        self._workbook = None
+        self._reset_read_caches()
+
+    def _reset_read_caches(self) -> None:
+        """
+        Drop all caches derived from the workbook file after it is (re)loaded.
+        """
+        self._sheet_cache.clear()
+        self._sheetnames = None
+        self._calamine_workbook = None
+        self._calamine_sheet_cache.clear()
+        if self._stream_reader is not None:
+            self._stream_reader.close()
+            self._stream_reader = None
+
+    def _get_ws(self, sheet_id: str):
+        """
+        Return the worksheet object for a sheet, caching the lookup.
+
+        Args:
+            sheet_id (str): Name of the sheet in the workbook.
+
+        Returns:
+            Worksheet: The OpenPyXL worksheet object.
+
+        Raises:
+            ValueError: If the sheet does not exist in the Excel file.
+        """
+        ws = self._sheet_cache.get(sheet_id)
+        if ws is None:
+            if sheet_id not in self.workbook.sheetnames:
+                raise ValueError(f"Sheet '{sheet_id}' does not exist in the Excel file.")
+            ws = self._sheet_cache[sheet_id] = self.workbook[sheet_id]
+        return ws
+
     def _find_sheet(self, sheet_id: Union[str, int]) -> Optional[SheetSchema]:
         """
         Find a sheet in the schema by its identifier.
@@ -582,57 +1405,189 @@ class ExcelDataPairer:
         Returns:
             Optional[SheetSchema]: The sheet schema if found, else None.
         """
-        
+
         if not self.file_schema:
             return None
         if isinstance(sheet_id, int):
             sheet_id = self.list_file_sheets()[sheet_id]
-        for sheet in self.file_schema.file_data:
-            if sheet.sheet_id == sheet_id:
-                return sheet
-        return None
+        return self._sheet_index.get(sheet_id)
 
-    def _read_range(self, sheet, cell_range: CellRange) -> List[Any]:
+    def _read_range(self, sheet_id: str, cell_range: CellRange) -> List[Any]:
         """
         Read data from a specified cell range within a sheet.
-        
+
         Args:
-            sheet: OpenPyXL worksheet object.
+            sheet_id (str): Name of the sheet.
             cell_range (CellRange): The cell range to read.
-        
+
         Returns:
             List[Any]: A list of cell values.
-        
+
         Raises:
             ValueError: If column or row range is invalid.
         """
-        if not cell_range.columns_range or not cell_range.rows_range:
-            raise ValueError("Both 'columns_range' and 'rows_range' must be specified in CellRange.")
-        
-        # Parse the columns range
-        try:
-            start_col_str, end_col_str = self._parse_range(cell_range.columns_range)
-            start_col = column_index_from_string(start_col_str.upper())
-            end_col = column_index_from_string(end_col_str.upper())
-        except ValueError as ve:
-            raise ValueError(f"Invalid columns_range: {ve}")
+        start_col, end_col, row_start, row_end = cell_range.parsed_bounds()
+        return self._read_values(sheet_id, start_col, end_col, row_start, row_end)
+
+    def _read_range_raw(self, sheet_id: str, columns_range: str, rows_range: str) -> List[Any]:
+        """
+        Read data from a range given directly as range strings, without building a CellRange.
+
+        Args:
+            sheet_id (str): Name of the sheet.
+            columns_range (str): Columns range (e.g., 'A-C').
+            rows_range (str): Rows range (e.g., '1-10').
+
+        Returns:
+            List[Any]: A list of cell values.
+
+        Raises:
+            ValueError: If column or row range is invalid.
+        """
+        start_col, end_col, row_start, row_end = _parse_bounds(columns_range, rows_range)
+        return self._read_values(sheet_id, start_col, end_col, row_start, row_end)
 
-        # Parse the rows range
+    def _read_values(self, sheet_id: str, start_col: int, end_col: int, row_start: int, row_end: int) -> List[Any]:
+        """
+        Read cell values from a sheet given already-parsed numeric bounds.
+        Routed by backend: calamine, then the streaming XML reader, then
+        openpyxl; only the openpyxl fallback touches the workbook object.
+
+        Args:
+            sheet_id (str): Name of the sheet.
+            start_col (int): First column (1-based).
+            end_col (int): Last column (1-based).
+            row_start (int): First row (1-based).
+            row_end (int): Last row (1-based).
+
+        Returns:
+            List[Any]: A flat list of cell values.
+        """
+        # Every backend reads the on-disk file, so deferred workbook edits
+        # must land first; this is the choke point for all value reads
+        self.flush()
+        # Prefer the Rust-backed calamine reader when available; it parses a
+        # sheet once and repeated range reads become plain list slicing
+        if CalamineWorkbook is not None:
+            rows = self._calamine_rows(sheet_id)
+            if rows is not None:
+                return self._slice_rows(rows, start_col, end_col, row_start, row_end)
+
+        # Next preference: stream only the requested rows out of the sheet XML
+        streamed = self._stream_rows(sheet_id, row_start, row_end, start_col, end_col)
+        if streamed is not None:
+            return [value for row in streamed for value in row]
+
+        # values_only=True skips Cell object construction entirely
+        with self._workbook_lock:
+            rows = list(self._get_ws(sheet_id).iter_rows(
+                min_row=row_start, max_row=row_end, min_col=start_col, max_col=end_col, values_only=True
+            ))
+        # iter_rows clips at the sheet's used area; re-slicing against the
+        # requested rectangle pads with None so every backend returns the
+        # same shape for the same range
+        return self._slice_rows(rows, 1, end_col - start_col + 1, 1, row_end - row_start + 1)
+
+    def _calamine_rows(self, sheet_id: str) -> Optional[List[List[Any]]]:
+        """
+        Return the full value grid of a sheet via python-calamine, cached per sheet.
+
+        Args:
+            sheet_id (str): Name of the sheet.
+
+        Returns:
+            Optional[List[List[Any]]]: The sheet's rows, or None if calamine
+            is unavailable or the sheet could not be read with it.
+        """
+        with self._workbook_lock:
+            rows = self._calamine_sheet_cache.get(sheet_id)
+            if rows is None:
+                try:
+                    if self._calamine_workbook is None:
+                        self._calamine_workbook = CalamineWorkbook.from_path(self.file_schema.file_path)
+                    raw = self._calamine_workbook.get_sheet_by_name(sheet_id).to_python(skip_empty_area=False)
+                except Exception:
+                    return None  # Fall back to the openpyxl read path
+                # Normalized once at cache time so every later slice is cheap
+                rows = [
+                    [self._normalize_calamine_value(value) for value in row]
+                    for row in raw
+                ]
+                self._calamine_sheet_cache[sheet_id] = rows
+            return rows
+
+    @staticmethod
+    def _normalize_calamine_value(value: Any) -> Any:
+        """
+        Map a calamine cell value onto what the openpyxl/stream backends
+        return for the same cell, so installing the optional dependency
+        never changes results: empty cells are None rather than '', whole
+        numbers are ints, and date cells are datetimes.
+        """
+        if isinstance(value, str):
+            return value or None
+        if isinstance(value, float):
+            return int(value) if value.is_integer() else value
+        if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+            return datetime.datetime(value.year, value.month, value.day)
+        return value
+
+    def _stream_rows(
+        self, sheet_name: str, min_row: int, max_row: int, min_col: int, max_col: int
+    ) -> Optional[List[Tuple]]:
+        """
+        Read row tuples for a range via the streaming XML reader, if possible.
+
+        Args:
+            sheet_name (str): Name of the sheet.
+            min_row (int): First row (1-based).
+            max_row (int): Last row (1-based).
+            min_col (int): First column (1-based).
+            max_col (int): Last column (1-based).
+
+        Returns:
+            Optional[List[Tuple]]: One tuple per row, or None if the streaming
+            reader could not handle the file (openpyxl is used instead).
+        """
         try:
-            row_start, row_end = self._parse_range(cell_range.rows_range)
-            if row_start.isdigit() and row_end.isdigit():
-                row_start, row_end = int(row_start), int(row_end)
-            if row_start > row_end:
-                raise ValueError(f"Start row {row_start} is greater than end row {row_end}.")
+            if self._stream_reader is None:
+                self._stream_reader = _XlsxStreamReader(self.file_schema.file_path)
+            return self._stream_reader.read_rows(sheet_name, min_row, max_row, min_col, max_col)
         except Exception:
-            raise ValueError(f"Invalid rows_range format: '{cell_range.rows_range}'. Expected format 'start-end'.")
+            return None  # Fall back to the openpyxl read path
 
-        # Collect data
-        data = []
-        for row in sheet.iter_rows(min_row=row_start, max_row=row_end, min_col=start_col, max_col=end_col):
-            for cell in row:
-                data.append(cell.value)
+    @staticmethod
+    def _slice_rows(rows: List[List[Any]], start_col: int, end_col: int, row_start: int, row_end: int) -> List[Any]:
+        """
+        Slice a rectangular range out of a full value grid, padding with None
+        where the grid is smaller than the requested range.
 
+        Args:
+            rows (List[List[Any]]): Full sheet rows.
+            start_col (int): First column (1-based).
+            end_col (int): Last column (1-based).
+            row_start (int): First row (1-based).
+            row_end (int): Last row (1-based).
+
+        Returns:
+            List[Any]: A flat list of cell values.
+        """
+        n_rows = len(rows)
+        if start_col == end_col:
+            # Single-column fast path: one indexed lookup per row
+            col = start_col - 1
+            return [
+                rows[row_i][col] if row_i < n_rows and col < len(rows[row_i]) else None
+                for row_i in range(row_start - 1, row_end)
+            ]
+        width = end_col - start_col + 1
+        data = []
+        for row_i in range(row_start - 1, row_end):
+            row = rows[row_i] if row_i < n_rows else ()
+            row_slice = row[start_col - 1:end_col]
+            data.extend(row_slice)
+            if len(row_slice) < width:
+                data.extend([None] * (width - len(row_slice)))
         return data
 
     def _parse_range(self, range_str: str) -> Tuple[str, str]:
@@ -648,14 +1603,7 @@ class ExcelDataPairer:
         Raises:
             ValueError: If the range format is invalid.
         """
-        if '-' not in range_str:
-            # Single column or row
-            return (range_str, range_str)
-        parts = range_str.split('-')
-        if len(parts) != 2:
-            raise ValueError(f"Invalid range format: '{range_str}'. Expected format 'start-end'.")
-        start, end = parts
-        return (start.strip(), end.strip())
+        return _split_range(range_str)
 
     # ---------------------------
     # Schema Serialization Methods
@@ -675,23 +1623,38 @@ class ExcelDataPairer:
             raise ValueError("No Excel file selected. Please select an Excel file to get the schema.")
         return self.file_schema
 
-    def to_json(self, indent: int = 4) -> str:
+    def to_json_bytes(self, indent: bool = True) -> bytes:
         """
-        Serialize the file schema to a JSON-formatted string.
-        
+        Serialize the file schema to JSON-encoded bytes using orjson.
+
         Args:
-            indent (int, optional): Indentation level for JSON formatting. Defaults to 4.
-        
+            indent (bool): If True, indent with 2 spaces; autosaves pass
+                           False since the file is only machine-read.
+
         Returns:
-            str: JSON representation of the file schema.
-        
+            bytes: JSON representation of the file schema.
+
         Raises:
             ValueError: If no file is selected.
         """
         if not self.file_schema:
             raise ValueError("No Excel file selected. Please select an Excel file to serialize the schema.")
-        # Use Pydantic v2's model_dump_json
-        return self.file_schema.model_dump_json(indent=indent)
+        return orjson.dumps(
+            _file_schema_adapter().dump_python(self.file_schema, mode='json'),
+            option=orjson.OPT_INDENT_2 if indent else 0,
+        )
+
+    def to_json(self) -> str:
+        """
+        Serialize the file schema to a JSON-formatted string.
+
+        Returns:
+            str: JSON representation of the file schema.
+
+        Raises:
+            ValueError: If no file is selected.
+        """
+        return self.to_json_bytes().decode('utf-8')
 
     def save_to_file(self, output_path: Optional[str] = None) -> None:
         """
@@ -710,8 +1673,10 @@ class ExcelDataPairer:
             output_path = os.path.splitext(self.file_schema.file_path)[0] + ".json"
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(self.to_json())
+            # Write the orjson bytes directly; decoding to str and re-encoding
+            # on write would double the peak memory for large schemas
+            with open(output_path, 'wb') as f:
+                f.write(self.to_json_bytes())
             print(f"Schema saved to '{output_path}' successfully.")
             self._autosave_config()
         except Exception as e:
@@ -731,14 +1696,24 @@ class ExcelDataPairer:
         """
         if not os.path.exists(json_path):
             raise FileNotFoundError(f"The JSON file '{json_path}' does not exist.")
-        
+
+        self.flush()  # Unsaved edits belong to the currently selected file
+        old_path = self.file_schema.file_path if self.file_schema else None
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
+            with open(json_path, 'rb') as f:
                 json_data = f.read()
-            # Use Pydantic v2's model_validate_json
-            self.file_schema = FileSchema.model_validate_json(json_data)
-            # Reload the workbook to match the updated schema
-            self.workbook = load_workbook(filename=self.file_schema.file_path, data_only=True)
+            # orjson parses the bytes; Pydantic validates the resulting dict
+            self.file_schema = _file_schema_adapter().validate_python(orjson.loads(json_data))
+            if self.file_schema.file_path != old_path:
+                # The workbook matching the updated schema is reloaded lazily
+                # (closing the old file's handle); when the path is unchanged
+                # the open workbook and its read caches are still valid
+                self._reload_readonly_workbook()
+                self._rw_workbook = None
+                self._workbook_dirty = False
+            self._sheet_index = {
+                sheet.sheet_id: sheet for sheet in self.file_schema.file_data if sheet.sheet_id
+            }
             print(f"Schema loaded from '{json_path}' successfully.")
             self._autosave_config()
         except ValidationError as e:
@@ -750,6 +1725,42 @@ class ExcelDataPairer:
     # Workbook Manipulation Methods
     # ---------------------------
 
+    def flush(self) -> None:
+        """
+        Write any deferred workbook changes to disk.
+
+        update_cell and remove_sheet_from_workbook only mutate the in-memory
+        writable workbook; the full .xlsx rewrite happens here — once per
+        batch of edits — triggered by the next read, by select_excel_file,
+        by load_from_file, or on exiting a `with` block. Edits still pending
+        when the interpreter exits are NOT saved; call flush() or use the
+        pairer as a context manager to guarantee persistence.
+        """
+        if not self._workbook_dirty:
+            return
+        # Save to a sibling temp file and swap it in atomically so a failed
+        # save can never corrupt the user's workbook.
+        tmp_path = self.file_schema.file_path + '.tmp'
+        try:
+            self._rw_workbook.save(tmp_path)
+            os.replace(tmp_path, self.file_schema.file_path)
+            self._workbook_dirty = False
+            self._reload_readonly_workbook()
+        except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            print(f"Failed to save workbook: {e}")
+
+    def __enter__(self) -> "ExcelDataPairer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+        if self._autosave_pending:
+            self._flush_autosave()
+
     def update_cell(self, sheet_id: Union[str, int], cell: str, value: Any) -> None:
         """
         Update the value of a specific cell in a sheet and save the workbook.
@@ -762,21 +1773,20 @@ class ExcelDataPairer:
         Raises:
             ValueError: If the sheet does not exist or no file is selected.
         """
-        if not self.workbook:
+        if not self.file_schema:
             raise ValueError("No Excel file selected. Please select an Excel file before updating cells.")
         if isinstance(sheet_id, int):
             sheet_id = self.list_file_sheets()[sheet_id]
-        if sheet_id not in self.workbook.sheetnames:
+        if sheet_id not in self.list_file_sheets():
             raise ValueError(f"Sheet '{sheet_id}' does not exist in the Excel file.")
         
-        sheet = self.workbook[sheet_id]
+        rw_workbook = self._get_rw_workbook()
+        sheet = rw_workbook[sheet_id]
         sheet[cell] = value
-        try:
-            self.workbook.save(self.file_schema.file_path)
-            print(f"Cell '{cell}' in sheet '{sheet_id}' updated to '{value}'.")
-            self._autosave_config()
-        except Exception as e:
-            print(f"Failed to save workbook after updating cell '{cell}': {e}")
+        # The full .xlsx rewrite is deferred to flush(); reads flush first
+        self._workbook_dirty = True
+        print(f"Cell '{cell}' in sheet '{sheet_id}' updated to '{value}'.")
+        self._autosave_config()
 
     # -------------------------------
     # End of ExcelNavigator Class